@@ -2,11 +2,33 @@
 
 #(c) Type-smart, Tiny Canvas inc 
 
-import json, os, time, sys, tty, termios, random, shutil
+import atexit, json, os, time, sys, tty, termios, random, select, shutil
+from array import array
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cache
+
+# orjson serializes several times faster than the stdlib and returns
+# bytes directly; fall back to json when it isn't installed.
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = lambda o: json.dumps(o).encode()
+    _loads = json.loads
 
 PROGRESS_FILE = os.path.expanduser("~/.typing_progress_v10.json")
 
+# Hot working copy lives on tmpfs (XDG runtime dir) so saves never hit
+# the disk mid-session; it is copied back to $HOME on graceful exit.
+_RUNTIME_DIR = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+RUNTIME_FILE = os.path.join(_RUNTIME_DIR, "typing_progress_v10.json")
+
+# Coalesce bursts of save_progress calls into at most one write per
+# debounce window; force=True bypasses it (exit, log compaction fold).
+SAVE_DEBOUNCE_SECS = 2.0
+
 # THEMES
 
 THEMES = {
@@ -39,31 +61,56 @@ THEMES = {
 # Default theme
 THEME = THEMES["neon"]
 
-# SAMPLE LEVEL DATA (you can expand these)
-
-BEGINNER_LEVEL = [
-    "asdf jkl qwe rty",
-    "zxcv bn m po iu",
-    "qaz wsx edc rfv",
-] + [f"wordset {i}" for i in range(10)]
+# Hot-loop escape strings, materialized from THEME so each keystroke
+# does plain string concatenation instead of dict lookups + f-strings.
+def _materialize_theme():
+    global _GOOD_PREFIX, _BAD_PREFIX, _RESET, _HUD_PREFIX
+    _GOOD_PREFIX = THEME["good"]
+    _BAD_PREFIX = THEME["bad"]
+    _RESET = THEME["reset"]
+    _HUD_PREFIX = "\r" + THEME["hud"] + "WPM: "
 
-INTERMEDIATE_LEVEL = [
-    "The quick brown fox jumps over the lazy dog.",
-    "Typing improves focus and muscle memory.",
-] + [f"Intermediate sentence {i}" for i in range(10)]
+_materialize_theme()
 
-EXPERT_LEVEL = [
-    "Expert typing requires endurance, precision, and mental stamina.",
-    "Long-form typing helps develop high sustained WPM.",
-] + [f"Expert paragraph {i}" for i in range(10)]
+# SAMPLE LEVEL DATA (you can expand these)
+#
+# Levels are built lazily and cached as immutable tuples, so importing
+# the module doesn't allocate filler strings for levels never practiced.
+
+_LEVEL_SPECS = {
+    1: ((
+        "asdf jkl qwe rty",
+        "zxcv bn m po iu",
+        "qaz wsx edc rfv",
+    ), "wordset {}"),
+    2: ((
+        "The quick brown fox jumps over the lazy dog.",
+        "Typing improves focus and muscle memory.",
+    ), "Intermediate sentence {}"),
+    3: ((
+        "Expert typing requires endurance, precision, and mental stamina.",
+        "Long-form typing helps develop high sustained WPM.",
+    ), "Expert paragraph {}"),
+}
 
-LEVELS = {1: BEGINNER_LEVEL, 2: INTERMEDIATE_LEVEL, 3: EXPERT_LEVEL}
+@cache
+def get_level(n):
+    base, filler = _LEVEL_SPECS[n]
+    return (*base, *(filler.format(i) for i in range(10)))
 
 # LOAD PROGRESS
 
-if os.path.exists(PROGRESS_FILE):
-    with open(PROGRESS_FILE, "r") as f:
-        progress = json.load(f)
+# refresh the runtime copy from $HOME if the canonical file is newer
+# (first run of a session, or progress carried over from another host)
+if os.path.exists(PROGRESS_FILE) and (
+    not os.path.exists(RUNTIME_FILE)
+    or os.path.getmtime(PROGRESS_FILE) > os.path.getmtime(RUNTIME_FILE)
+):
+    shutil.copy(PROGRESS_FILE, RUNTIME_FILE)
+
+if os.path.exists(RUNTIME_FILE):
+    with open(RUNTIME_FILE, "rb") as f:
+        progress = _loads(f.read())
 else:
     progress = {
         "theme": "neon",
@@ -78,108 +125,372 @@ else:
         "custom_lessons": []
     }
 
+# Heatmap counts live in two flat arrays indexed by ASCII ordinal, so a
+# keystroke update is one array increment instead of nested dict lookups.
+# They are serialized into progress["heatmap"] as plain lists on save.
+_hm = progress.get("heatmap", {})
+if isinstance(_hm.get("correct"), list):
+    correct_counts = array("I", _hm["correct"])
+    wrong_counts = array("I", _hm["wrong"])
+else:
+    correct_counts = array("I", [0] * 128)
+    wrong_counts = array("I", [0] * 128)
+    for _key, _data in _hm.items():  # migrate the old per-key dict format
+        if _key:
+            _o = ord(_key[0]) & 0x7f
+            correct_counts[_o] += _data.get("correct", 0)
+            wrong_counts[_o] += _data.get("wrong", 0)
+del _hm
+
 THEME = THEMES.get(progress["theme"], THEMES["neon"])
+_materialize_theme()
+
+def save_progress(force=False):
+    global _event_count, _last_save
+    now = time.time()
+    if not force and now - _last_save < SAVE_DEBOUNCE_SECS:
+        return
+    _last_save = now
+    progress["heatmap"] = {
+        "correct": list(correct_counts),
+        "wrong": list(wrong_counts),
+    }
+    tmp = RUNTIME_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_dumps(progress))
+    os.replace(tmp, RUNTIME_FILE)
+    # the canonical file now embodies every logged event
+    if _event_log is not None:
+        _event_log.truncate(0)
+    elif os.path.exists(EVENT_LOG_FILE):
+        open(EVENT_LOG_FILE, "w").close()
+    _event_count = 0
+
+# EVENT LOG
+#
+# Frequent updates (keystrokes, completed sets) are appended to a small
+# newline-delimited JSON log instead of rewriting the whole progress
+# file each time. The log is replayed into `progress` on startup and
+# folded back into the canonical JSON ("compacted") periodically and on
+# exit.
+
+EVENT_LOG_FILE = os.path.join(_RUNTIME_DIR, "typing_progress_v10.log")
+EVENT_COMPACT_EVERY = 1000
+
+_event_log = None
+_event_count = 0
+_last_save = 0.0
+
+def _apply_event(ev):
+    if "k" in ev:
+        o = ord(ev["k"]) & 0x7f
+        (correct_counts if ev["ok"] else wrong_counts)[o] += 1
+    elif "set_done" in ev:
+        progress["total_words"] += ev["words"]
+        progress["total_time"] += ev["dt"]
+        if ev.get("advance"):
+            progress["current_set"] += 1
+    elif "err" in ev:
+        progress["total_errors"] += 1
+
+def _replay_event_log():
+    if not os.path.exists(EVENT_LOG_FILE):
+        return
+    replayed = 0
+    with open(EVENT_LOG_FILE, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                _apply_event(_loads(line))
+            except ValueError:
+                continue  # torn line from a crash; skip it
+            replayed += 1
+    if replayed:
+        save_progress(force=True)
+
+def log_event(ev):
+    global _event_log, _event_count
+    if _event_log is None:
+        _event_log = open(EVENT_LOG_FILE, "ab")
+    _event_log.write(_dumps(ev) + b"\n")
+    _event_log.flush()
+    _event_count += 1
+    if _event_count >= EVENT_COMPACT_EVERY:
+        save_progress()
 
-def save_progress():
-    tmp = PROGRESS_FILE + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(progress, f)
-    os.replace(tmp, PROGRESS_FILE)
+def _sync_home():
+    save_progress(force=True)
+    shutil.copy(RUNTIME_FILE, PROGRESS_FILE)
+
+_replay_event_log()
+atexit.register(_sync_home)
 
 # HELPERS
 
+_rng = random.Random()
+
 def normalize(s):
     return " ".join(s.strip().split())
 
-def beep_correct():
-    sys.stdout.write("\a")
-    sys.stdout.flush()
-
-def beep_wrong():
-    sys.stdout.write("\a\033[91m\033[1m")
-    sys.stdout.flush()
+# Level targets never change, so normalize them once per level instead
+# of on every attempt/retry in practice_level.
+@cache
+def get_normalized_level(n):
+    return tuple(normalize(s) for s in get_level(n))
+
+# Bulk character matching. Used for whole-attempt comparisons (retry
+# feedback, offline stats over many attempts); the per-keystroke path
+# stays incremental. Best available backend wins: numba JIT, then a
+# NumPy elementwise compare (SIMD byte comparison under the hood), then
+# a plain Python loop.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    try:
+        from numba import njit
+
+        @njit(cache=True, nogil=True)
+        def _count_matches_u8(a, b):
+            n = min(a.size, b.size)
+            correct = 0
+            for i in range(n):
+                if a[i] == b[i]:
+                    correct += 1
+            return correct
+    except ImportError:
+        def _count_matches_u8(a, b):
+            n = min(a.size, b.size)
+            return np.count_nonzero(a[:n] == b[:n])
+
+    def count_matches(typed, target):
+        a = np.frombuffer(typed.encode(), dtype=np.uint8)
+        b = np.frombuffer(target.encode(), dtype=np.uint8)
+        return int(_count_matches_u8(a, b)), max(a.size, b.size)
+
+    # warm up front (JIT compile / first-call dispatch) so the first
+    # real call doesn't pay for it
+    count_matches("a", "a")
+else:
+    def count_matches(typed, target):
+        # compare encoded bytes like the accelerated tiers, so the
+        # reported counts don't depend on which backend is installed
+        a = typed.encode()
+        b = target.encode()
+        correct = sum(1 for x, y in zip(a, b) if x == y)
+        return correct, max(len(a), len(b))
+
+# all 31 possible default-width bars, built once — rendering becomes a
+# table lookup instead of two string multiplications per call
+_BARS = tuple("[" + "#" * i + "-" * (30 - i) + "]" for i in range(31))
 
 def progress_bar(current, total, width=30):
     filled = int((current / total) * width)
+    if width == 30:
+        return _BARS[filled]
     return "[" + "#" * filled + "-" * (width - filled) + "]"
 
 # KEYBOARD HEATMAP UPDATE
 
 def update_heatmap(key, correct):
-    hm = progress["heatmap"]
-    if key not in hm:
-        hm[key] = {"correct": 0, "wrong": 0}
-    if correct:
-        hm[key]["correct"] += 1
-    else:
-        hm[key]["wrong"] += 1
-    save_progress()
+    o = ord(key) & 0x7f
+    (correct_counts if correct else wrong_counts)[o] += 1
+    log_event({"k": key, "ok": int(correct)})
 
 # REAL-TIME TYPING ENGINE
 
+# Output frame budget: echoes are batched and painted together unless
+# the input has been idle this long, so paste/fast-typing bursts cost
+# one screen update per frame instead of one per key.
+FRAME_SECS = 0.006
+
+# Input drained from the tty but not yet consumed when a prompt ended
+# (e.g. a paste containing several lines). The next prompt picks it up
+# before reading again, so no pasted bytes are lost between prompts.
+_pending_input = b""
+
+@contextmanager
+def raw_mode_session():
+    """Make stdin unbuffered once for a whole practice session.
+
+    Entering/leaving cbreak mode costs two termios syscalls; doing it
+    per prompt added that cost before every line. Callers wrap a full
+    mode (practice, test, custom lessons) and live_typing_prompt just
+    reads. cbreak rather than raw: it keeps OPOST, so the prints
+    between prompts still get \\n -> \\r\\n translation.
+    """
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    try:
+        yield fd
+    finally:
+        termios.tcsetattr(fd, termios.TCSANOW, old_settings)
+
 def live_typing_prompt(target):
-    global THEME
+    global THEME, _pending_input
     print(f"\n{THEME['accent']}Type this:{THEME['reset']}")
     print(f"{THEME['accent']}> {target}{THEME['reset']}\n")
 
     typed = ""
-    start = time.time()
+    typed_len = 0  # characters typed (not bytes)
+    # compare raw input bytes against the target's bytes: int == int on
+    # the ASCII fast path, a short bytes compare for multi-byte chars.
+    # tgt_pos tracks the byte offset matching typed_len characters.
+    tgt = target.encode("utf-8")
+    tgt_len = len(tgt)
+    tgt_pos = 0
+    char_lens = []  # encoded length per typed char, for backspace undo
+    correct_count = 0
+    correct_flags = []  # per-position correctness, so backspace can undo
+    word_count = 0
+    last_beep = 0.0
+
+    # hoist hot globals/attributes into locals: LOAD_FAST instead of a
+    # dict lookup per reference inside the keystroke loop
+    _now = time.time
+    _write = sys.stdout.write
+    _flush = sys.stdout.flush
+    _read = os.read
+    _select = select.select
+    _good, _bad, _reset, _hud = _GOOD_PREFIX, _BAD_PREFIX, _RESET, _HUD_PREFIX
+    _heat = update_heatmap
+
+    start = _now()
     fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
+    # drained input burst; one read(2) can serve many keys. Starts with
+    # whatever the previous prompt left unconsumed (multi-line paste).
+    buf = _pending_input
+    _pending_input = b""
+    i = 0
+    pending = []  # echo fragments accumulated for the current frame
+    esc_state = 0  # 0 = normal, 1 = saw ESC, 2 = inside a CSI sequence
+    utf8_buf = bytearray()  # partial multi-byte character
+    utf8_need = 0
 
-    try:
-        tty.setraw(fd)
-        while True:
-            ch = sys.stdin.read(1)
-
-            # ENTER ends typing
-            if ch in ("\r", "\n"):
-                print("")
+    while True:
+        if i >= len(buf):
+            # Frame the output: if more input is already arriving
+            # within the 6ms budget keep accumulating, otherwise paint
+            # everything gathered so far in one write. Under paste this
+            # turns N screen updates into one per frame.
+            if pending:
+                if not _select([fd], [], [], FRAME_SECS)[0]:
+                    elapsed = max(0.001, _now() - start)
+                    wpm = (word_count / elapsed) * 60
+                    acc = (correct_count / typed_len) * 100 if typed_len else 100
+                    _write(
+                        "".join(pending)
+                        + _hud + f"{wpm:.1f} | Accuracy: {acc:.1f}%" + _reset
+                    )
+                    _flush()
+                    pending.clear()
+                    _select([fd], [], [], None)
+            else:
+                _select([fd], [], [], None)
+            buf = _read(fd, 4096)
+            i = 0
+            if not buf:
                 break
-
-            # BACKSPACE
-            elif ch in ("\x7f", "\x08"):
-                if typed:
-                    typed = typed[:-1]
-                    sys.stdout.write("\b \b")
-                    sys.stdout.flush()
+        b = buf[i]
+        i += 1
+
+        # swallow escape sequences (arrow keys etc.) instead of
+        # treating their bytes as typed characters. A sequence can be
+        # split across reads, so track state rather than scanning only
+        # the current buffer.
+        if esc_state == 2:  # inside CSI, wait for the final byte
+            if 0x40 <= b <= 0x7e:
+                esc_state = 0
+            continue
+        if esc_state == 1:
+            esc_state = 0
+            if b == 0x5b:  # CSI: ESC [
+                esc_state = 2
                 continue
+            # lone ESC: fall through and treat this byte normally
+        if b == 0x1b:
+            esc_state = 1
+            continue
 
-            typed += ch
-
-            # WPM & accuracy
-            elapsed = max(0.001, time.time() - start)
-            wpm = (len(typed.split()) / elapsed) * 60
-            correct_chars = sum(
-                typed[i] == target[i] if i < len(target) else False
-                for i in range(len(typed))
-            )
-            acc = (correct_chars / len(typed)) * 100 if typed else 100
-
-            # color feedback
-            correct_char = len(typed) <= len(target) and ch == target[len(typed)-1]
-            update_heatmap(ch, correct_char)
-
-            if correct_char:
-                sys.stdout.write(f"{THEME['good']}{ch}{THEME['reset']}")
-                beep_correct()
-            else:
-                sys.stdout.write(f"{THEME['bad']}{ch}{THEME['reset']}")
-                beep_wrong()
+        # incremental UTF-8: collect a lead byte and its continuations
+        # (possibly arriving in separate reads) into one character
+        if b >= 0x80:
+            if not utf8_buf:
+                utf8_need = 2 if b < 0xe0 else 3 if b < 0xf0 else 4
+            utf8_buf.append(b)
+            if len(utf8_buf) < utf8_need:
+                continue
+            kb = bytes(utf8_buf)
+            utf8_buf.clear()
+            ch = kb.decode("utf-8", "replace")
+        else:
+            kb = None
+            ch = chr(b)
+
+        # ENTER ends typing; stash the unread tail for the next prompt
+        if ch in ("\r", "\n"):
+            _pending_input = buf[i:]
+            if pending:
+                _write("".join(pending))
+                _flush()
+            print("")
+            break
 
-            sys.stdout.flush()
+        # BACKSPACE
+        elif ch in ("\x7f", "\x08"):
+            if typed:
+                removed = typed[-1]
+                typed = typed[:-1]
+                typed_len -= 1
+                tgt_pos -= char_lens.pop()
+                if correct_flags.pop():
+                    correct_count -= 1
+                # removed the first char of a word?
+                if removed != " " and (not typed or typed[-1] == " "):
+                    word_count -= 1
+                pending.append("\b \b")
+            continue
 
-            sys.stdout.write(
-                f"\r{THEME['hud']}WPM: {wpm:.1f} | Accuracy: {acc:.1f}%{THEME['reset']}"
-            )
-            sys.stdout.flush()
+        if kb is None:
+            enc_len = 1
+            correct_char = tgt_pos < tgt_len and b == tgt[tgt_pos]
+        else:
+            enc_len = len(kb)
+            correct_char = tgt[tgt_pos:tgt_pos + enc_len] == kb
+        # starting a new word?
+        if ch != " " and (not typed or typed[-1] == " "):
+            word_count += 1
+        typed += ch
+        typed_len += 1
+        tgt_pos += enc_len
+        char_lens.append(enc_len)
+        correct_flags.append(correct_char)
+        if correct_char:
+            correct_count += 1
+
+        # color feedback — queued for the frame flush above, which adds
+        # the WPM/accuracy HUD. Bell only on mistakes, throttled so fast
+        # typing doesn't spam the terminal's bell handler.
+        if correct_char:
+            pending.append(_good + ch + _reset)
+        else:
+            frag = _bad + ch + _reset
+            now = _now()
+            if now - last_beep > 0.1:
+                frag += "\a"
+                last_beep = now
+            pending.append(frag)
 
-        print("\n")
+        _heat(ch, correct_char)
 
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    print("\n")
 
-    elapsed = time.time() - start
+    elapsed = _now() - start
     return typed, elapsed
 
 # TYPING TEST MODE
@@ -189,10 +500,14 @@ def typing_test(minutes):
     deadline = time.time() + minutes * 60
     total_typed = ""
 
-    while time.time() < deadline:
-        sample = random.choice(LEVELS[3])
-        typed, _ = live_typing_prompt(sample)
-        total_typed += " " + typed
+    items = get_level(3)
+    n = len(items)
+
+    with raw_mode_session():
+        while time.time() < deadline:
+            sample = items[_rng.randrange(n)]
+            typed, _ = live_typing_prompt(sample)
+            total_typed += " " + typed
 
     words = len(total_typed.split())
     wpm = words / minutes
@@ -203,61 +518,73 @@ def typing_test(minutes):
 # PRACTICE LEVEL
 
 def practice_level(level_number, daily=False, random_mode=False):
-    level_sets = LEVELS[level_number]
+    level_sets = get_level(level_number)
+    norm_sets = get_normalized_level(level_number)
+    n = len(level_sets)
 
-    # random mode
+    # random mode: shuffle indices instead of copying the string list
     if random_mode:
-        sets = random.sample(level_sets, len(level_sets))
+        order = list(range(n))
+        _rng.shuffle(order)
         set_idx = 0
     else:
-        sets = level_sets
+        order = None
         set_idx = progress["current_set"]
 
-    while set_idx < len(sets):
-        item = sets[set_idx]
-        typed, elapsed = live_typing_prompt(item)
+    with raw_mode_session():
+        while set_idx < n:
+            j = order[set_idx] if order is not None else set_idx
+            item = level_sets[j]
+            typed, elapsed = live_typing_prompt(item)
 
-        if normalize(typed) == normalize(item):
-            print(f"{THEME['good']}Correct!{THEME['reset']}\n")
+            if normalize(typed) == norm_sets[j]:
+                print(f"{THEME['good']}Correct!{THEME['reset']}\n")
 
-            progress["total_words"] += len(item.split())
-            progress["total_time"] += elapsed
+                progress["total_words"] += len(item.split())
+                progress["total_time"] += elapsed
 
-            if not random_mode:
-                progress["current_set"] += 1
+                if not random_mode:
+                    progress["current_set"] += 1
 
-            set_idx += 1
-            save_progress()
-        else:
-            print(f"{THEME['bad']}Incorrect. Try again.{THEME['reset']}\n")
-            progress["total_errors"] += 1
-            save_progress()
-            continue
+                set_idx += 1
+                log_event({
+                    "set_done": 1,
+                    "words": len(item.split()),
+                    "dt": elapsed,
+                    "advance": 0 if random_mode else 1,
+                })
+            else:
+                matched, total = count_matches(normalize(typed), norm_sets[j])
+                print(f"{THEME['bad']}Incorrect ({matched}/{total} chars). Try again.{THEME['reset']}\n")
+                progress["total_errors"] += 1
+                log_event({"err": 1})
+                continue
 
-        bar = progress_bar(set_idx, len(sets))
-        print(f"Progress: {bar} {set_idx}/{len(sets)}\n")
+            bar = progress_bar(set_idx, n)
+            print(f"Progress: {bar} {set_idx}/{n}\n")
 
     print(f"\n{THEME['good']}🎉 Level {level_number} completed!{THEME['reset']}\n")
 
     if level_number < 3:
         progress["level"] += 1
         progress["current_set"] = 0
-    save_progress()
+    save_progress(force=True)
 
 # CUSTOM LESSONS
 
 def add_custom_lesson():
     text = input("Enter text for your custom lesson:\n> ").strip()
     progress["custom_lessons"].append(text)
-    save_progress()
+    save_progress(force=True)
     print("Custom lesson added!\n")
 
 def practice_custom_lessons():
     if not progress["custom_lessons"]:
         print("No custom lessons yet!\n")
         return
-    for lesson in progress["custom_lessons"]:
-        live_typing_prompt(lesson)
+    with raw_mode_session():
+        for lesson in progress["custom_lessons"]:
+            live_typing_prompt(lesson)
 
 # DAILY PRACTICE
 
@@ -266,7 +593,7 @@ def daily_practice():
     if progress["last_practice"] != today:
         progress["streak"] += 1
         progress["last_practice"] = today
-        save_progress()
+        save_progress(force=True)
 
     print(f"\n{THEME['accent']}--- Daily Practice (Day {progress['streak']}) ---{THEME['reset']}\n")
     practice_level(progress["level"], daily=True)
@@ -289,10 +616,12 @@ def show_stats():
     print(f"Last Practice: {progress['last_practice']}\n")
 
     print("--- Heatmap (Accuracy by Key) ---")
-    for key, data in progress["heatmap"].items():
-        total = data["correct"] + data["wrong"]
-        acc = (data["correct"] / total) * 100 if total else 100
-        print(f"{repr(key)}: {acc:.1f}% accuracy")
+    for o in range(128):
+        total = correct_counts[o] + wrong_counts[o]
+        if not total:
+            continue
+        acc = (correct_counts[o] / total) * 100
+        print(f"{repr(chr(o))}: {acc:.1f}% accuracy")
 
 # THEME SWITCHER
 
@@ -305,7 +634,8 @@ def change_theme():
         progress["theme"] = choice
         global THEME
         THEME = THEMES[choice]
-        save_progress()
+        _materialize_theme()
+        save_progress(force=True)
         print("Theme changed!\n")
     else:
         print("Invalid theme.\n")
@@ -352,4 +682,9 @@ def main():
             print("Invalid choice!\n")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except KeyboardInterrupt:
+        # Ctrl-C mid-prompt: raw_mode_session's finally has already
+        # restored the terminal and the atexit hook saves progress.
+        print("\nInterrupted — progress saved. Bye!")